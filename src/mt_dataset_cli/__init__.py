@@ -2,7 +2,12 @@
 mt-dataset-cli 라이브러리
 """
 
-from .downloader import StatMTDownloader
-
 __version__ = "0.1.0"
 __all__ = ["StatMTDownloader"]
+
+def __getattr__(name):
+    # 패키지 임포트 시 무거운 의존성을 불러오지 않도록 다운로더는 처음 접근할 때 임포트
+    if name == "StatMTDownloader":
+        from .downloader import StatMTDownloader
+        return StatMTDownloader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
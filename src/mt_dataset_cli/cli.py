@@ -7,19 +7,41 @@ import sys
 import json
 import argparse
 import logging
+from itertools import islice
 from typing import List, Optional, Dict
 
-from .downloader import StatMTDownloader
-from .utils import extract_archive
+logger = logging.getLogger(__name__)
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler()]
-)
+def positive_int(value: str) -> int:
+    """
+    1 이상의 정수 인수 파싱 (argparse type 용)
+    
+    Args:
+        value: 명령줄 인수 문자열
+    
+    Returns:
+        파싱된 정수
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수가 아닙니다: {value}")
+    
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상의 정수여야 합니다: {value}")
+    return number
 
-logger = logging.getLogger(__name__)
+def setup_logging():
+    """
+    명령줄 실행용 로깅 설정
+    
+    모듈을 임포트하는 것만으로 루트 로거 설정이 바뀌지 않도록 main()에서 호출합니다.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.StreamHandler()]
+    )
 
 def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     """
@@ -49,7 +71,10 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     download_parser.add_argument("--output-dir", "-o", default="./data", help="출력 디렉토리 (기본값: ./data)")
     download_parser.add_argument("--force", "-f", action="store_true", help="기존 파일 덮어쓰기")
     download_parser.add_argument("--extract", "-e", action="store_true", help="다운로드 후 자동 압축 해제")
-    download_parser.add_argument("--max-workers", "-w", type=int, default=4, help="최대 동시 다운로드 수 (기본값: 4)")
+    download_parser.add_argument("--stream-extract", action="store_true",
+                        help="tar.gz 아카이브를 저장하지 않고 다운로드하면서 바로 압축 해제")
+    download_parser.add_argument("--max-workers", "-w", type=positive_int, default=4, help="최대 동시 다운로드 수 (기본값: 4)")
+    download_parser.add_argument("--max-connections", type=positive_int, default=16, help="호스트별 최대 동시 HTTP 연결 수 (기본값: 16)")
     
     # 여러 데이터셋 다운로드 서브커맨드
     batch_parser = subparsers.add_parser("batch", help="설정 파일을 사용하여 여러 데이터셋 다운로드")
@@ -57,7 +82,10 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     batch_parser.add_argument("--output-dir", "-o", default="./data", help="출력 디렉토리 (기본값: ./data)")
     batch_parser.add_argument("--force", "-f", action="store_true", help="기존 파일 덮어쓰기")
     batch_parser.add_argument("--extract", "-e", action="store_true", help="다운로드 후 자동 압축 해제")
-    batch_parser.add_argument("--max-workers", "-w", type=int, default=4, help="최대 동시 다운로드 수 (기본값: 4)")
+    batch_parser.add_argument("--stream-extract", action="store_true",
+                        help="tar.gz 아카이브를 저장하지 않고 다운로드하면서 바로 압축 해제")
+    batch_parser.add_argument("--max-workers", "-w", type=positive_int, default=4, help="최대 동시 다운로드 수 (기본값: 4)")
+    batch_parser.add_argument("--max-connections", type=positive_int, default=16, help="호스트별 최대 동시 HTTP 연결 수 (기본값: 16)")
     
     # 캐시 관리 서브커맨드
     cache_parser = subparsers.add_parser("cache", help="캐시 관리")
@@ -76,20 +104,24 @@ def load_batch_config(config_path: str) -> List[Dict]:
     Returns:
         배치 구성 목록
     """
+    # cli 모듈 임포트 시 무거운 의존성을 불러오지 않도록 함수 안에서 임포트
+    from .utils import read_json_file
+    
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = read_json_file(config_path)
         
         if isinstance(config, list):
             return config
-        elif isinstance(config, dict) and "datasets" in config:
-            return config["datasets"]
+        
+        datasets = config.get("datasets") if isinstance(config, dict) else None
+        if datasets is not None:
+            return datasets
         else:
             raise ValueError("구성 파일은 데이터셋 배열 또는 'datasets' 키를 포함하는 객체여야 합니다.")
     
     except json.JSONDecodeError:
         raise ValueError("유효하지 않은 JSON 파일입니다.")
-    except Exception as e:
+    except OSError as e:
         raise ValueError(f"구성 파일 로드 중 오류 발생: {e}")
 
 def main(args: Optional[List[str]] = None) -> int:
@@ -104,37 +136,50 @@ def main(args: Optional[List[str]] = None) -> int:
     """
     parsed_args = parse_args(args)
     
+    # 로깅 설정
+    setup_logging()
+    
     if not parsed_args.command:
         print("명령어를 지정해주세요. 사용 가능한 명령어: list, download, batch, cache")
         return 1
     
+    # 다운로더 모듈은 requests/lxml/tqdm 등 무거운 의존성을 불러오므로
+    # 인수 파싱(--help 등)이 끝난 뒤 실제로 필요할 때만 임포트
+    from .downloader import StatMTDownloader
+    
     # 명령어에 따른 동작 수행
     if parsed_args.command == "list":
         # 다운로더 인스턴스 생성
         downloader = StatMTDownloader()
         datasets = downloader.list_datasets()
         
-        print("\n사용 가능한 데이터셋:")
-        print("=" * 80)
+        # 출력 내용을 모아 한 번에 기록 (항목마다 print를 호출하지 않음)
+        lines = ["\n사용 가능한 데이터셋:", "=" * 80]
         
         for dataset in datasets:
-            print(f"ID: {dataset['id']}")
-            print(f"설명: {dataset.get('description', '설명 없음')}")
+            lines.append(f"ID: {dataset['id']}")
+            lines.append(f"설명: {dataset.get('description', '설명 없음')}")
             
-            if "language_pairs" in dataset:
-                print(f"지원하는 언어 쌍: {', '.join(dataset['language_pairs'])}")
+            language_pairs = dataset.get("language_pairs")
+            if language_pairs is not None:
+                lines.append(f"지원하는 언어 쌍: {', '.join(language_pairs)}")
             
-            if "categories" in dataset:
-                print(f"지원하는 카테고리: {', '.join(dataset['categories'])}")
+            categories = dataset.get("categories")
+            if categories is not None:
+                lines.append(f"지원하는 카테고리: {', '.join(categories)}")
             
-            print("-" * 80)
+            lines.append("-" * 80)
         
+        print("\n".join(lines))
         return 0
     
     elif parsed_args.command == "download":
         try:
             # 다운로더 인스턴스 생성
-            downloader = StatMTDownloader(max_workers=parsed_args.max_workers)
+            downloader = StatMTDownloader(
+                max_workers=parsed_args.max_workers,
+                max_connections=parsed_args.max_connections
+            )
             
             # 데이터셋 다운로드
             result = downloader.download(
@@ -143,13 +188,14 @@ def main(args: Optional[List[str]] = None) -> int:
                 language_pair=parsed_args.language_pair,
                 category=parsed_args.category,
                 auto_extract=parsed_args.extract,
-                force=parsed_args.force
+                force=parsed_args.force,
+                stream_extract=parsed_args.stream_extract
             )
             
             if isinstance(result, list):
-                print(f"\n다운로드 완료: {len(result)}개 파일")
-                for file_path in result:
-                    print(f"  - {file_path}")
+                lines = [f"\n다운로드 완료: {len(result)}개 파일"]
+                lines.extend(f"  - {file_path}" for file_path in result)
+                print("\n".join(lines))
             else:
                 print(f"\n다운로드 완료: {result}")
             
@@ -169,26 +215,30 @@ def main(args: Optional[List[str]] = None) -> int:
                 return 1
             
             # 다운로더 인스턴스 생성
-            downloader = StatMTDownloader(max_workers=parsed_args.max_workers)
+            downloader = StatMTDownloader(
+                max_workers=parsed_args.max_workers,
+                max_connections=parsed_args.max_connections
+            )
             
             # 여러 데이터셋 다운로드
             results = downloader.download_multiple(
                 dataset_configs=batch_config,
                 parent_dir=parsed_args.output_dir,
                 auto_extract=parsed_args.extract,
-                force=parsed_args.force
+                force=parsed_args.force,
+                stream_extract=parsed_args.stream_extract
             )
             
-            print("\n다운로드 완료 요약:")
-            print("=" * 80)
+            lines = ["\n다운로드 완료 요약:", "=" * 80]
             
             total_files = 0
             for dataset_id, files in results.items():
-                print(f"{dataset_id}: {len(files)}개 파일")
+                lines.append(f"{dataset_id}: {len(files)}개 파일")
                 total_files += len(files)
             
-            print("-" * 80)
-            print(f"총계: {len(results)}개 데이터셋, {total_files}개 파일")
+            lines.append("-" * 80)
+            lines.append(f"총계: {len(results)}개 데이터셋, {total_files}개 파일")
+            print("\n".join(lines))
             
             return 0
             
@@ -210,13 +260,14 @@ def main(args: Optional[List[str]] = None) -> int:
             print(f"캐시 디렉토리: {downloader.downloader.cache_dir}")
             
             # 다운로드 정보 표시
-            if "downloads" in downloader.metadata:
-                downloads = downloader.metadata["downloads"]
+            downloads = downloader.metadata.get("downloads")
+            if downloads is not None:
                 print(f"캐시된 다운로드: {len(downloads)}개")
                 
                 if downloads:
                     print("\n최근 다운로드:")
-                    for i, (url, info) in enumerate(list(downloads.items())[:5]):
+                    # 전체 항목을 리스트로 복사하지 않고 앞의 5개만 순회
+                    for i, (url, info) in enumerate(islice(downloads.items(), 5)):
                         print(f"{i+1}. {os.path.basename(info['path'])} (URL: {url})")
             
             return 0
@@ -5,18 +5,227 @@ StatMT 크롤러 - 데이터셋 정보를 크롤링하기 위한 전략 패턴 
 import os
 import re
 import abc
+import html
+import hashlib
+import time
 import logging
-from typing import Dict, List, Optional, Union
+import threading
+import concurrent.futures
+from typing import Dict, List, Optional, Tuple, Union
 import requests
-from bs4 import BeautifulSoup
+import lxml.etree
+import lxml.html
+
+from .utils import REQUEST_TIMEOUT, create_session, read_json_file, write_json_file
 
 logger = logging.getLogger(__name__)
 
+# 링크 추출용 정규식 (Apache 디렉토리 목록은 형식이 단순하므로 DOM 생성 없이 스캔)
+# data-href 등 다른 속성과 구분하도록 href 앞에 공백을 요구하고, 따옴표 없는 값도 허용
+_HREF_RE = re.compile(
+    r'<a\s(?:[^>]*?\s)?href\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))',
+    re.IGNORECASE
+)
+# 문서 앞의 XML 선언 (lxml은 인코딩 선언이 있는 str 입력을 거부함)
+_XML_DECLARATION_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+# Apache 디렉토리 목록(autoindex) 페이지 판별 (<title>Index of /...</title>)
+_AUTOINDEX_TITLE_RE = re.compile(r'<title>\s*Index of\b', re.IGNORECASE)
+
+# Europarl 파일명에서 언어 쌍 추출 (예: fr-en-train.tgz)
+_EUROPARL_LP_RE = re.compile(r'^(?P<lp>[a-z]{2}-[a-z]{2})-train\.tgz$')
+
+# News Commentary 파일명에서 언어 쌍 추출 (예: news-commentary-v15.de-en.tsv.gz)
+_NEWS_COMMENTARY_LP_RE = re.compile(r'\.([a-z]{2}-[a-z]{2})\.tsv(?:\.gz)?$')
+
+# 데이터셋 ID 끝의 버전 또는 연도 번호 추출 (예: europarl-v7 -> 7, wmt14 -> 14)
+_DATASET_ID_NUMBER_RE = re.compile(r'[vV]?(\d+)$')
+
+# 캐싱된 링크 목록을 서버 확인 없이 그대로 사용할 기간 (초, 메모리/디스크 캐시 공통)
+LISTING_CACHE_TTL = 3600
+
+# 프로세스 전체에서 공유하는 페이지 캐시 (URL -> (가져온 시각, 추출된 href 목록))
+_PAGE_CACHE: Dict[str, Tuple[float, List[str]]] = {}
+# 같은 URL을 여러 스레드가 동시에 요청할 때 한 번만 가져오기 위한 URL별 Lock (가져오는 동안만 유지)
+_PAGE_LOCKS: Dict[str, threading.Lock] = {}
+_PAGE_LOCKS_GUARD = threading.Lock()
+
+def _extract_hrefs(content: str) -> List[str]:
+    """
+    HTML 문서에서 링크(href) 목록 추출
+    
+    Args:
+        content: HTML 문서 문자열
+        
+    Returns:
+        문서에 등장하는 순서대로 정렬된 href 목록 (열 정렬 링크 제외)
+    """
+    hrefs = []
+    
+    # 정규식은 주석이 없는 Apache 디렉토리 목록에만 사용
+    # (직접 작성된 페이지는 주석 안의 링크 등으로 결과가 틀릴 수 있으므로 HTML 파서 사용)
+    if _AUTOINDEX_TITLE_RE.search(content) and "<!--" not in content:
+        hrefs = [
+            html.unescape(href) if "&" in href else href
+            for href in ("".join(groups) for groups in _HREF_RE.findall(content))
+            if href
+        ]
+    
+    if not hrefs:
+        # 그 외 페이지 또는 정규식으로 링크를 찾지 못한 페이지는 HTML 파서(lxml)로 처리
+        # 디코딩은 이미 끝났으므로 XHTML 페이지의 XML 선언(<?xml ... encoding=...?>)은 제거하고 파싱
+        content = _XML_DECLARATION_RE.sub("", content, count=1)
+        tree = lxml.html.fromstring(content) if content.strip() else None
+        hrefs = [str(href) for href in tree.xpath("//a/@href") if href] if tree is not None else []
+    
+    # Apache 디렉토리 목록의 열 정렬 링크(?C=N;O=D 등)는 같은 페이지를 가리키므로 제외
+    return [href for href in hrefs if not href.startswith("?")]
+
 class CrawlerStrategy(abc.ABC):
     """
     데이터셋 크롤링을 위한 전략 인터페이스
     """
     
+    # 데이터셋 ID 끝의 번호를 전달받을 생성자 인수 ("version", "year" 또는 None)
+    DATASET_ID_PARAM: Optional[str] = None
+    
+    def __init__(self, session: Optional[requests.Session] = None,
+                 cache_dir: Optional[str] = None):
+        """
+        CrawlerStrategy 초기화
+        
+        Args:
+            session: 요청에 사용할 HTTP 세션 (기본값: 새 세션 생성)
+            cache_dir: 페이지 링크 목록을 디스크에 캐싱할 디렉토리 (None이면 디스크 캐시 사용 안 함)
+        """
+        # 같은 호스트에 대한 요청끼리 연결(keep-alive)을 재사용하기 위해 세션 공유
+        self.session = session or create_session()
+        self.listing_cache_dir = os.path.join(cache_dir, "listings") if cache_dir else None
+    
+    def _get_hrefs(self, url: str) -> List[str]:
+        """
+        페이지를 가져와 링크 목록 반환 (같은 URL은 LISTING_CACHE_TTL 동안 프로세스당 한 번만 요청 및 파싱)
+        
+        Args:
+            url: 페이지 URL
+            
+        Returns:
+            href 목록
+        """
+        cached = _PAGE_CACHE.get(url)
+        if cached and time.time() - cached[0] < LISTING_CACHE_TTL:
+            return list(cached[1])
+        
+        with _PAGE_LOCKS_GUARD:
+            lock = _PAGE_LOCKS.setdefault(url, threading.Lock())
+        
+        try:
+            with lock:
+                # 기다리는 동안 다른 스레드가 이미 가져왔을 수 있으므로 다시 확인
+                cached = _PAGE_CACHE.get(url)
+                if cached and time.time() - cached[0] < LISTING_CACHE_TTL:
+                    return list(cached[1])
+                
+                # 링크 추출 결과를 캐싱하여 같은 페이지를 다시 파싱하지 않음
+                hrefs = self._fetch_hrefs(url)
+                _PAGE_CACHE[url] = (time.time(), hrefs)
+                return list(hrefs)
+        finally:
+            # 요청이 끝난 URL의 Lock은 제거하여 Lock이 URL 수만큼 계속 쌓이지 않도록 함
+            with _PAGE_LOCKS_GUARD:
+                if _PAGE_LOCKS.get(url) is lock:
+                    del _PAGE_LOCKS[url]
+    
+    def _fetch_hrefs(self, url: str) -> List[str]:
+        """
+        페이지를 요청하여 링크 목록 추출
+        
+        디스크 캐시의 결과가 LISTING_CACHE_TTL 이내에 확인된 것이면 요청 없이 사용하고,
+        그보다 오래되었으면 ETag/Last-Modified로 조건부 요청을 보내
+        304 Not Modified 응답일 때 캐시된 링크 목록을 그대로 사용합니다.
+        
+        Args:
+            url: 페이지 URL
+            
+        Returns:
+            href 목록
+        """
+        cache_path = None
+        cached = None
+        headers = {}
+        
+        if self.listing_cache_dir:
+            cache_path = os.path.join(
+                self.listing_cache_dir, f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+            )
+            cached = self._load_listing(cache_path)
+            if cached:
+                if time.time() - cached.get("checked_at", 0) < LISTING_CACHE_TTL:
+                    logger.debug(f"캐시된 페이지 사용 (TTL 이내): {url}")
+                    return cached["hrefs"]
+                
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+        
+        response = self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        
+        if cached and response.status_code == 304:
+            logger.debug(f"캐시된 페이지 사용 (변경 없음): {url}")
+            # 확인 시각을 갱신하여 TTL 동안 다시 요청하지 않도록 함
+            cached["checked_at"] = int(time.time())
+            self._save_listing(cache_path, cached)
+            return cached["hrefs"]
+        
+        response.raise_for_status()
+        hrefs = _extract_hrefs(response.text)
+        
+        if cache_path:
+            self._save_listing(cache_path, {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "checked_at": int(time.time()),
+                "hrefs": hrefs
+            })
+        
+        return hrefs
+    
+    @staticmethod
+    def _load_listing(cache_path: str) -> Optional[Dict]:
+        """디스크 캐시에서 링크 목록 로드"""
+        if not os.path.exists(cache_path):
+            return None
+        
+        try:
+            listing = read_json_file(cache_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"페이지 캐시 로드 중 오류 발생: {cache_path} - {e}")
+            return None
+        
+        # 형식이 맞지 않는 캐시 파일은 캐시가 없는 것으로 처리
+        if not isinstance(listing, dict) or not isinstance(listing.get("hrefs"), list):
+            logger.warning(f"페이지 캐시 형식이 올바르지 않아 무시합니다: {cache_path}")
+            return None
+        
+        # 확인 시각이 숫자가 아니면 오래된 캐시로 보고 서버에 다시 확인
+        if not isinstance(listing.get("checked_at"), (int, float)):
+            listing["checked_at"] = 0
+        
+        return listing
+    
+    @staticmethod
+    def _save_listing(cache_path: str, listing: Dict):
+        """링크 목록을 디스크 캐시에 저장"""
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # 다른 프로세스가 읽는 도중 깨진 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            write_json_file(tmp_path, listing)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"페이지 캐시 저장 중 오류 발생: {cache_path} - {e}")
+    
     @abc.abstractmethod
     def get_dataset_urls(self, **kwargs) -> List[Dict[str, str]]:
         """
@@ -31,8 +240,11 @@ class EuroparlCrawler(CrawlerStrategy):
     """Europarl 데이터셋을 위한 크롤러 전략"""
     
     BASE_URL = "http://statmt.org/europarl/"
+    DATASET_ID_PARAM = "version"
     
-    def __init__(self, version: str = "v7"):
+    def __init__(self, version: str = "v7", session: Optional[requests.Session] = None,
+                 cache_dir: Optional[str] = None):
+        super().__init__(session, cache_dir)
         self.version = version
         self.base_url = f"{self.BASE_URL}{version}/"
     
@@ -48,35 +260,31 @@ class EuroparlCrawler(CrawlerStrategy):
         """
         # 메인 페이지 크롤링
         try:
-            response = requests.get(self.base_url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "lxml")
-            
             urls = []
             
             # 링크 찾기
-            for link in soup.find_all("a"):
-                href = link.get("href")
-                if not href:
+            for href in self._get_hrefs(self.base_url):
+                # 파일명 형식 확인과 언어 쌍 추출을 한 번에 수행 (예: fr-en-train.tgz)
+                match = _EUROPARL_LP_RE.match(href)
+                if not match:
                     continue
                 
+                lp = match.group("lp")
+                
                 # 특정 언어 쌍이 지정된 경우 필터링
-                if language_pair and language_pair not in href:
+                if language_pair and language_pair != lp:
                     continue
                 
-                if href.endswith(".tgz") and "-train" in href:
-                    # 예: fr-en-train.tgz
-                    lp = href.split("-train")[0]
-                    urls.append({
-                        "url": f"{self.base_url}{href}",
-                        "filename": href,
-                        "language_pair": lp,
-                        "description": f"Europarl {self.version} {lp} 말뭉치"
-                    })
+                urls.append({
+                    "url": f"{self.base_url}{href}",
+                    "filename": href,
+                    "language_pair": lp,
+                    "description": f"Europarl {self.version} {lp} 말뭉치"
+                })
             
             return urls
             
-        except Exception as e:
+        except (requests.RequestException, lxml.etree.LxmlError, ValueError) as e:
             logger.error(f"Europarl 데이터셋 크롤링 중 오류 발생: {e}")
             return []
 
@@ -84,8 +292,11 @@ class NewsCommentaryCrawler(CrawlerStrategy):
     """News Commentary 데이터셋을 위한 크롤러 전략"""
     
     BASE_URL = "http://data.statmt.org/news-commentary/"
+    DATASET_ID_PARAM = "version"
     
-    def __init__(self, version: str = "v15"):
+    def __init__(self, version: str = "v15", session: Optional[requests.Session] = None,
+                 cache_dir: Optional[str] = None):
+        super().__init__(session, cache_dir)
         self.version = version
         self.base_url = f"{self.BASE_URL}{version}/training/"
     
@@ -100,41 +311,33 @@ class NewsCommentaryCrawler(CrawlerStrategy):
             URL 정보 목록
         """
         try:
-            response = requests.get(self.base_url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "lxml")
-            
             urls = []
+            prefix = f"news-commentary-{self.version}"
             
             # 링크 찾기
-            for link in soup.find_all("a"):
-                href = link.get("href")
-                if not href:
+            for href in self._get_hrefs(self.base_url):
+                if not href.startswith(prefix):
                     continue
                 
-                if not href.startswith(f"news-commentary-{self.version}"):
-                    continue
-                
-                if href.endswith(".tsv.gz") or href.endswith(".tsv"):
-                    # 파일명에서 언어 쌍 추출
-                    match = re.search(r'\.([a-z]{2}-[a-z]{2})\.(tsv|tsv\.gz)$', href)
-                    if match:
-                        lp = match.group(1)
-                        
-                        # 특정 언어 쌍이 지정된 경우 필터링
-                        if language_pair and language_pair != lp:
-                            continue
-                        
-                        urls.append({
-                            "url": f"{self.base_url}{href}",
-                            "filename": href,
-                            "language_pair": lp,
-                            "description": f"News Commentary {self.version} {lp} 말뭉치"
-                        })
+                # 파일명에서 언어 쌍 추출 (.tsv / .tsv.gz 확장자 확인 포함)
+                match = _NEWS_COMMENTARY_LP_RE.search(href)
+                if match:
+                    lp = match.group(1)
+                    
+                    # 특정 언어 쌍이 지정된 경우 필터링
+                    if language_pair and language_pair != lp:
+                        continue
+                    
+                    urls.append({
+                        "url": f"{self.base_url}{href}",
+                        "filename": href,
+                        "language_pair": lp,
+                        "description": f"News Commentary {self.version} {lp} 말뭉치"
+                    })
             
             return urls
             
-        except Exception as e:
+        except (requests.RequestException, lxml.etree.LxmlError, ValueError) as e:
             logger.error(f"News Commentary 데이터셋 크롤링 중 오류 발생: {e}")
             return []
 
@@ -142,8 +345,11 @@ class WMTCrawler(CrawlerStrategy):
     """WMT 데이터셋을 위한 크롤러 전략"""
     
     BASE_URL = "http://statmt.org/wmt{year}/"
+    DATASET_ID_PARAM = "year"
     
-    def __init__(self, year: str = "14"):
+    def __init__(self, year: str = "14", session: Optional[requests.Session] = None,
+                 cache_dir: Optional[str] = None):
+        super().__init__(session, cache_dir)
         self.year = year
         self.base_url = self.BASE_URL.format(year=year)
     
@@ -158,19 +364,11 @@ class WMTCrawler(CrawlerStrategy):
             URL 정보 목록
         """
         try:
-            response = requests.get(self.base_url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "lxml")
-            
             urls = []
             
             # 먼저 카테고리 링크 찾기
             category_links = {}
-            for link in soup.find_all("a"):
-                href = link.get("href")
-                if not href:
-                    continue
-                
+            for href in self._get_hrefs(self.base_url):
                 # 카테고리 링크 확인
                 if category and category in href:
                     category_links[category] = f"{self.base_url}{href}"
@@ -179,31 +377,35 @@ class WMTCrawler(CrawlerStrategy):
                     category_links[cat] = f"{self.base_url}{href}"
             
             # 각 카테고리 페이지에서 데이터셋 파일 링크 찾기
-            for cat, cat_url in category_links.items():
+            def crawl_category(cat: str, cat_url: str) -> List[Dict[str, str]]:
                 try:
-                    cat_response = requests.get(cat_url)
-                    cat_response.raise_for_status()
-                    cat_soup = BeautifulSoup(cat_response.text, "lxml")
-                    
-                    for link in cat_soup.find_all("a"):
-                        href = link.get("href")
-                        if not href:
-                            continue
-                        
-                        if href.endswith((".tgz", ".gz", ".tar.gz", ".zip")):
-                            urls.append({
-                                "url": f"{cat_url.rstrip('/')}/{href}",
-                                "filename": href,
-                                "category": cat,
-                                "description": f"WMT{self.year} {cat} 데이터셋 - {href}"
-                            })
+                    return [
+                        {
+                            "url": f"{cat_url.rstrip('/')}/{href}",
+                            "filename": href,
+                            "category": cat,
+                            "description": f"WMT{self.year} {cat} 데이터셋 - {href}"
+                        }
+                        for href in self._get_hrefs(cat_url)
+                        if href.endswith((".tgz", ".gz", ".tar.gz", ".zip"))
+                    ]
                 
-                except Exception as e:
+                except (requests.RequestException, lxml.etree.LxmlError, ValueError) as e:
                     logger.warning(f"WMT{self.year} {cat} 카테고리 크롤링 중 오류 발생: {e}")
+                    return []
+            
+            if not category_links:
+                return urls
+            
+            # 카테고리 페이지는 서로 독립적이므로 동시에 요청 (결과 순서는 카테고리 순서 유지)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(category_links)) as executor:
+                for category_urls in executor.map(crawl_category, category_links.keys(),
+                                                  category_links.values()):
+                    urls.extend(category_urls)
             
             return urls
             
-        except Exception as e:
+        except (requests.RequestException, lxml.etree.LxmlError, ValueError) as e:
             logger.error(f"WMT{self.year} 데이터셋 크롤링 중 오류 발생: {e}")
             return []
 
@@ -236,29 +438,34 @@ class CrawlerFactory:
     }
     
     @classmethod
-    def get_crawler(cls, dataset_id: str) -> CrawlerStrategy:
+    def get_crawler(cls, dataset_id: str,
+                    session: Optional[requests.Session] = None,
+                    cache_dir: Optional[str] = None) -> CrawlerStrategy:
         """
         데이터셋 ID에 맞는 크롤러 전략 인스턴스 반환
         
         Args:
             dataset_id: 데이터셋 ID (예: "europarl-v7", "wmt14")
+            session: 크롤러가 공유할 HTTP 세션
+            cache_dir: 페이지 링크 목록 디스크 캐시 디렉토리
             
         Returns:
             크롤러 전략 인스턴스
         """
         for prefix, crawler_class in cls.CRAWLERS.items():
-            if dataset_id.startswith(prefix):
-                # 버전 또는 연도 추출
-                version_match = re.search(r'[vV]?(\d+)$', dataset_id)
-                year_match = re.search(r'(\d+)$', dataset_id)
-                
-                if version_match and prefix != "wmt":
-                    version = f"v{version_match.group(1)}"
-                    return crawler_class(version=version)
-                elif year_match and prefix == "wmt":
-                    year = year_match.group(1)
-                    return crawler_class(year=year)
-                else:
-                    return crawler_class()
+            if not dataset_id.startswith(prefix):
+                continue
+            
+            kwargs = {"session": session, "cache_dir": cache_dir}
+            
+            # 버전 또는 연도를 받는 크롤러에만 ID 끝의 번호 전달
+            # (고정 URL을 사용하는 UNCrawler 등은 un-corpus-v1.0처럼 번호가 있어도 전달하지 않음)
+            param = crawler_class.DATASET_ID_PARAM
+            match = _DATASET_ID_NUMBER_RE.search(dataset_id) if param else None
+            if match:
+                number = match.group(1)
+                kwargs[param] = f"v{number}" if param == "version" else number
+            
+            return crawler_class(**kwargs)
         
         raise ValueError(f"지원되지 않는 데이터셋 ID: {dataset_id}") 
\ No newline at end of file
@@ -2,10 +2,12 @@
 StatMT 다운로더 - statmt.org의 데이터셋을 다운로드하기 위한 기능 제공
 """
 
+import io
 import os
-import json
 import logging
+import tarfile
 import threading
+import contextlib
 import concurrent.futures
 from typing import Dict, List, Optional, Set, Tuple, Union, Callable
 from pathlib import Path
@@ -14,20 +16,67 @@ import requests
 from tqdm import tqdm
 
 from .crawler import CrawlerFactory, CrawlerStrategy
-from .utils import extract_archive
+from .utils import (
+    REQUEST_TIMEOUT, canonicalize_url, create_session, extract_archive,
+    extract_tar, open_gzip, read_json_file, write_json_file
+)
 
 logger = logging.getLogger(__name__)
 
+# 스트리밍 다운로드 시 한 번에 읽는 크기 (청크마다 파이썬 루프와 진행률 갱신이 실행되므로 크게 설정)
+CHUNK_SIZE = 1024 * 1024
+# 구간 분할 다운로드를 사용할 최소 파일 크기 (작은 파일은 요청 오버헤드가 더 큼)
+SEGMENTED_DOWNLOAD_MIN_SIZE = 64 * 1024 * 1024
+
+# 다운로드와 동시에 스트리밍 방식으로 압축 해제할 수 있는 아카이브 확장자
+STREAMABLE_ARCHIVE_EXTENSIONS = (".tgz", ".tar.gz")
+
+class _RangeNotSupportedError(Exception):
+    """서버가 HEAD 응답과 달리 범위 요청에 206 Partial Content로 응답하지 않음"""
+
+class _ProgressReader(io.RawIOBase):
+    """읽은 바이트 수를 진행률 표시줄에 반영하는 읽기 전용 스트림 래퍼"""
+    
+    def __init__(self, fileobj, progress_bar: tqdm, total_size: int,
+                 on_progress: Optional[Callable[[int, int], None]] = None):
+        super().__init__()
+        self.fileobj = fileobj
+        self.progress_bar = progress_bar
+        self.total_size = total_size
+        self.on_progress = on_progress
+        # 진행률 표시줄이 꺼져 있으면 tqdm이 카운트를 하지 않으므로 직접 집계
+        self.bytes_read = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        data = self.fileobj.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        
+        if size:
+            self.bytes_read += size
+            self.progress_bar.update(size)
+            if self.on_progress:
+                self.on_progress(self.bytes_read, self.total_size)
+        return size
+
 class Downloader:
     """파일 다운로드 클래스"""
     
-    def __init__(self, cache_dir: Optional[str] = None):
+    def __init__(self, cache_dir: Optional[str] = None,
+                 session: Optional[requests.Session] = None, segments: int = 4):
         """
         Downloader 초기화
         
         Args:
             cache_dir: 다운로드된 파일을 캐싱하는 디렉토리 (기본값: ~/.mt_dataset_cli/cache)
+            session: 다운로드에 사용할 HTTP 세션 (기본값: 새 세션 생성)
+            segments: 큰 파일을 나누어 동시에 받을 구간 수 (1이면 분할하지 않음)
         """
+        self.session = session or create_session()
+        self.segments = max(1, segments)
         self.cache_dir = cache_dir or os.path.expanduser("~/.mt_dataset_cli/cache")
         os.makedirs(self.cache_dir, exist_ok=True)
         
@@ -39,14 +88,17 @@ class Downloader:
         
         # 스레드 Lock
         self.lock = threading.Lock()
+        
+        # 메타데이터 저장 지연 상태 (deferred_save 블록 중첩 수, 저장되지 않은 변경 여부)
+        self._save_depth = 0
+        self._dirty = False
     
     def _load_metadata(self) -> Dict:
         """메타데이터 캐시 파일에서 메타데이터 로드"""
         if os.path.exists(self.metadata_cache_file):
             try:
-                with open(self.metadata_cache_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception as e:
+                return read_json_file(self.metadata_cache_file)
+            except (OSError, ValueError) as e:
                 logger.warning(f"메타데이터 로드 중 오류 발생: {e}")
                 return {"downloads": {}, "datasets": {}}
         return {"downloads": {}, "datasets": {}}
@@ -55,14 +107,63 @@ class Downloader:
         """메타데이터를 캐시 파일에 저장"""
         try:
             with self.lock:
-                with open(self.metadata_cache_file, "w", encoding="utf-8") as f:
-                    json.dump(self.metadata, f, ensure_ascii=False, indent=2)
-        except Exception as e:
+                # 저장 도중 중단되어도 기존 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체
+                tmp_path = f"{self.metadata_cache_file}.{os.getpid()}.tmp"
+                write_json_file(tmp_path, self.metadata)
+                os.replace(tmp_path, self.metadata_cache_file)
+                self._dirty = False
+        except (OSError, TypeError) as e:
             logger.warning(f"메타데이터 저장 중 오류 발생: {e}")
     
+    @contextlib.contextmanager
+    def deferred_save(self):
+        """
+        블록 안에서 발생한 메타데이터 저장을 모아 블록이 끝날 때 한 번만 저장
+        
+        여러 파일을 동시에 받을 때 다운로드가 끝날 때마다 메타데이터 전체를
+        다시 직렬화하지 않도록 합니다.
+        """
+        with self.lock:
+            self._save_depth += 1
+        
+        try:
+            yield
+        finally:
+            with self.lock:
+                self._save_depth -= 1
+                pending = self._save_depth == 0 and self._dirty
+            
+            if pending:
+                self._save_metadata()
+    
+    def _record_download(self, url: str, path: str, **info):
+        """
+        다운로드 기록을 메타데이터에 추가하고 저장
+        
+        Args:
+            url: 다운로드한 URL
+            path: 저장된 파일 또는 압축 해제된 디렉토리 경로
+            **info: 함께 기록할 추가 정보
+        """
+        with self.lock:
+            self.metadata.setdefault("downloads", {})[url] = {
+                "path": path,
+                "timestamp": int(os.path.getmtime(path)),
+                **info
+            }
+            self._dirty = True
+            
+            # deferred_save 블록 안에서는 블록이 끝날 때 한 번에 저장
+            if self._save_depth:
+                return
+        
+        # _save_metadata가 같은 Lock을 사용하므로 Lock을 해제한 뒤 저장
+        self._save_metadata()
+    
     def download_file(self, url: str, target_dir: str, 
                     filename: Optional[str] = None, force: bool = False,
-                    on_progress: Optional[Callable[[int, int], None]] = None) -> str:
+                    on_progress: Optional[Callable[[int, int], None]] = None,
+                    show_progress: bool = True) -> str:
         """
         단일 파일 다운로드
         
@@ -72,6 +173,7 @@ class Downloader:
             filename: 저장할 파일명 (None인 경우 URL에서 추출)
             force: 이미 존재하는 파일도 강제로 다시 다운로드할지 여부
             on_progress: 진행률 콜백 함수 (current_size, total_size)
+            show_progress: 파일별 진행률 표시줄 출력 여부
             
         Returns:
             다운로드된 파일 경로
@@ -92,46 +194,220 @@ class Downloader:
         
         logger.info(f"다운로드 중: {url} -> {output_path}")
         
+        # 중단된 다운로드가 완료된 파일로 오인되지 않도록 임시 파일에 받은 뒤 완료 시 교체
+        part_path = f"{output_path}.part"
+        
         try:
-            with requests.get(url, stream=True) as response:
-                response.raise_for_status()
-                total_size = int(response.headers.get("content-length", 0))
-                
-                with open(output_path, "wb") as f, tqdm(
-                    total=total_size, unit="B", unit_scale=True, desc=filename
-                ) as progress_bar:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            progress_bar.update(len(chunk))
-                            
-                            if on_progress:
-                                on_progress(progress_bar.n, total_size)
+            # 범위 요청을 지원하는 큰 파일은 구간별로 나누어 동시에 다운로드
+            total_size = self._get_ranged_size(url) if self.segments > 1 else None
+            
+            if total_size:
+                try:
+                    self._download_segmented(url, part_path, total_size, filename,
+                                             on_progress, show_progress)
+                except _RangeNotSupportedError as e:
+                    # HEAD에서는 범위 요청을 지원한다고 했지만 실제로는 지원하지 않는 서버
+                    logger.info(f"범위 요청이 거부되어 단일 연결로 다시 다운로드: {url} - {e}")
+                    total_size = None
+            
+            if not total_size:
+                self._download_stream(url, part_path, filename, on_progress, show_progress)
+            
+            os.replace(part_path, output_path)
             
             logger.info(f"다운로드 완료: {output_path}")
             
             # 메타데이터 업데이트
-            with self.lock:
-                if "downloads" not in self.metadata:
-                    self.metadata["downloads"] = {}
-                
-                self.metadata["downloads"][url] = {
-                    "path": output_path,
-                    "timestamp": int(os.path.getmtime(output_path))
-                }
-                self._save_metadata()
+            self._record_download(url, output_path)
             
             return output_path
             
         except Exception as e:
             logger.error(f"다운로드 중 오류 발생: {url} - {e}")
             # 다운로드 실패 시 부분적으로 다운로드된 파일 삭제
-            if os.path.exists(output_path):
+            if os.path.exists(part_path):
                 try:
-                    os.remove(output_path)
-                except:
+                    os.remove(part_path)
+                except OSError:
                     pass
             raise
+    
+    def download_and_extract(self, url: str, target_dir: str, force: bool = False,
+                             on_progress: Optional[Callable[[int, int], None]] = None,
+                             show_progress: bool = True) -> str:
+        """
+        tar.gz 아카이브를 디스크에 저장하지 않고 다운로드하면서 바로 압축 해제
+        
+        아카이브를 파일로 저장한 뒤 다시 읽어 압축을 푸는 대신 HTTP 응답을
+        gzip 해제 후 tarfile 스트리밍 모드로 직접 전달하므로 디스크 I/O가 절반으로 줄어듭니다.
+        
+        Args:
+            url: 다운로드할 아카이브 URL (.tgz / .tar.gz)
+            target_dir: 압축 해제 디렉토리
+            force: 이미 압축 해제한 기록이 있어도 다시 다운로드할지 여부
+            on_progress: 진행률 콜백 함수 (current_size, total_size)
+            show_progress: 파일별 진행률 표시줄 출력 여부
+            
+        Returns:
+            압축 해제된 디렉토리 경로
+        """
+        # 같은 위치에 이미 압축 해제한 기록이 있는 경우
+        info = self.metadata.get("downloads", {}).get(url)
+        if (not force and info and info.get("extracted")
+                and info.get("path") == target_dir and os.path.isdir(target_dir)):
+            logger.info(f"이미 압축 해제되어 있습니다: {target_dir}")
+            return target_dir
+        
+        os.makedirs(target_dir, exist_ok=True)
+        
+        logger.info(f"다운로드 및 압축 해제 중: {url} -> {target_dir}")
+        
+        try:
+            # 압축된 바이트를 그대로 받아야 하므로 전송 인코딩은 사용하지 않음
+            with self.session.get(url, stream=True, timeout=REQUEST_TIMEOUT,
+                                  headers={"Accept-Encoding": "identity"}) as response:
+                response.raise_for_status()
+                total_size = int(response.headers.get("content-length", 0))
+                
+                with tqdm(
+                    total=total_size, unit="B", unit_scale=True, desc=os.path.basename(url),
+                    disable=not show_progress
+                ) as progress_bar:
+                    reader = _ProgressReader(response.raw, progress_bar, total_size, on_progress)
+                    with open_gzip(reader) as f_gz, tarfile.open(fileobj=f_gz, mode="r|") as tar:
+                        extract_tar(tar, target_dir)
+            
+            logger.info(f"다운로드 및 압축 해제 완료: {target_dir}")
+            
+            self._record_download(url, target_dir, extracted=True)
+            
+            return target_dir
+            
+        except Exception as e:
+            logger.error(f"다운로드 및 압축 해제 중 오류 발생: {url} - {e}")
+            raise
+    
+    def _download_stream(self, url: str, output_path: str, desc: str,
+                         on_progress: Optional[Callable[[int, int], None]] = None,
+                         show_progress: bool = True):
+        """단일 연결로 파일 전체를 스트리밍 다운로드"""
+        with self.session.get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
+            total_size = int(response.headers.get("content-length", 0))
+            downloaded = 0
+            
+            with open(output_path, "wb") as f, tqdm(
+                total=total_size, unit="B", unit_scale=True, desc=desc,
+                disable=not show_progress
+            ) as progress_bar:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        downloaded += len(chunk)
+                        progress_bar.update(len(chunk))
+                        
+                        if on_progress:
+                            on_progress(downloaded, total_size)
+    
+    def _get_ranged_size(self, url: str) -> Optional[int]:
+        """
+        구간 분할 다운로드가 가능한 경우 파일 크기 반환
+        
+        Returns:
+            서버가 바이트 범위 요청을 지원하고 파일이 충분히 크면 파일 크기, 아니면 None
+        """
+        try:
+            response = self.session.head(
+                url, allow_redirects=True, timeout=REQUEST_TIMEOUT,
+                headers={"Accept-Encoding": "identity"}
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.debug(f"HEAD 요청 실패, 단일 연결로 다운로드: {url} - {e}")
+            return None
+        
+        if response.headers.get("Accept-Ranges", "").lower() != "bytes":
+            return None
+        
+        # 압축 전송되는 응답은 구간별로 따로 디코딩되어 이어 붙일 수 없으므로 단일 연결 사용
+        if response.headers.get("Content-Encoding", "identity").lower() != "identity":
+            return None
+        
+        total_size = int(response.headers.get("Content-Length", 0))
+        return total_size if total_size >= SEGMENTED_DOWNLOAD_MIN_SIZE else None
+    
+    def _download_segmented(self, url: str, output_path: str, total_size: int, desc: str,
+                            on_progress: Optional[Callable[[int, int], None]] = None,
+                            show_progress: bool = True):
+        """
+        HTTP Range 요청으로 파일을 여러 구간으로 나누어 동시에 다운로드
+        
+        각 구간은 미리 최종 크기로 만들어 둔 파일의 해당 오프셋에 직접 기록됩니다.
+        """
+        segment_size = -(-total_size // self.segments)
+        ranges = [
+            (start, min(start + segment_size, total_size) - 1)
+            for start in range(0, total_size, segment_size)
+        ]
+        
+        # 최종 크기의 파일을 미리 생성
+        with open(output_path, "wb") as f:
+            f.truncate(total_size)
+        
+        progress_lock = threading.Lock()
+        downloaded = 0
+        # 한 구간이 실패하면 나머지 구간의 수신을 중단시키기 위한 신호
+        stop = threading.Event()
+        
+        with tqdm(total=total_size, unit="B", unit_scale=True, desc=desc,
+                  disable=not show_progress) as progress_bar:
+            def fetch_range(start: int, end: int):
+                nonlocal downloaded
+                headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+                with self.session.get(url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT) as response:
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        raise _RangeNotSupportedError(f"HTTP {response.status_code}")
+                    if stop.is_set():
+                        return
+                    
+                    written = 0
+                    with open(output_path, "r+b") as f:
+                        f.seek(start)
+                        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                            if stop.is_set():
+                                return
+                            if chunk:
+                                f.write(chunk)
+                                written += len(chunk)
+                                
+                                with progress_lock:
+                                    downloaded += len(chunk)
+                                    progress_bar.update(len(chunk))
+                                    if on_progress:
+                                        on_progress(downloaded, total_size)
+                
+                if written != end - start + 1:
+                    raise ValueError(f"구간 다운로드 크기 불일치: bytes={start}-{end}, 수신 {written}바이트")
+            
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(ranges))
+            failed = False
+            try:
+                futures = [executor.submit(fetch_range, start, end) for start, end in ranges]
+                done, _ = concurrent.futures.wait(
+                    futures, return_when=concurrent.futures.FIRST_EXCEPTION
+                )
+                
+                errors = [future.exception() for future in done if future.exception()]
+                if errors:
+                    # 나머지 구간은 신호를 보내 중단시키고 끝나기를 기다리지 않음
+                    stop.set()
+                    failed = True
+                    
+                    # 범위 요청 거부는 호출자가 단일 연결로 다시 받을 수 있도록 우선 전달
+                    raise next((e for e in errors if isinstance(e, _RangeNotSupportedError)), errors[0])
+            finally:
+                executor.shutdown(wait=not failed)
 
 class MultiDownloader:
     """여러 파일을 동시에 다운로드하기 위한 클래스"""
@@ -148,7 +424,8 @@ class MultiDownloader:
         self.max_workers = max_workers
     
     def download_all(self, download_list: List[Dict], parent_dir: str,
-                    auto_extract: bool = False, force: bool = False) -> List[str]:
+                    auto_extract: bool = False, force: bool = False,
+                    stream_extract: bool = False) -> List[str]:
         """
         여러 파일 동시 다운로드
         
@@ -158,104 +435,221 @@ class MultiDownloader:
             parent_dir: 상위 다운로드 디렉토리
             auto_extract: 다운로드 후 자동 압축 해제 여부
             force: 이미 존재하는 파일도 강제 다운로드할지 여부
+            stream_extract: tar.gz 아카이브를 저장하지 않고 받으면서 바로 압축 해제할지 여부
+        
+        Returns:
+            다운로드된 파일 경로 목록 (스트리밍 압축 해제한 항목은 압축 해제 디렉토리)
+        """
+        # 중복 항목은 같은 작업을 공유하므로 경로 기준으로 한 번만 반환
+        return list(dict.fromkeys(
+            file_path for _, file_path in self.download_items(
+                download_list, parent_dir, auto_extract, force, stream_extract
+            )
+        ))
+    
+    def download_items(self, download_list: List[Dict], parent_dir: str,
+                       auto_extract: bool = False, force: bool = False,
+                       stream_extract: bool = False) -> List[Tuple[Dict, str]]:
+        """
+        여러 파일 동시 다운로드 (download_all과 같으나 항목별 결과를 반환)
+        
+        같은 URL을 같은 위치로 받는 항목들은 한 번만 다운로드하고 결과 경로를 공유합니다.
+        
+        Args:
+            download_list: 다운로드할 파일 정보 목록 (download_all과 동일)
+            parent_dir: 상위 다운로드 디렉토리
+            auto_extract: 다운로드 후 자동 압축 해제 여부
+            force: 이미 존재하는 파일도 강제 다운로드할지 여부
+            stream_extract: tar.gz 아카이브를 저장하지 않고 받으면서 바로 압축 해제할지 여부
         
         Returns:
-            다운로드된 파일 경로 목록
+            (download_list의 항목, 다운로드된 파일 경로) 튜플 목록 (실패한 항목은 제외)
         """
         results = []
         completed_count = 0
-        total_count = len(download_list)
         
-        # 프로그레스 바 설정
-        progress_bar = tqdm(total=total_count, desc="전체 다운로드 진행률")
+        # 다운로드 작업 목록 구성 ((URL, 저장 경로) -> 작업 번호)
+        jobs = []
+        job_index = {}
+        
+        for item in download_list:
+            url = item["url"]
+            filename = item.get("filename")
+            
+            # 디렉토리 경로 설정
+            item_target_dir = item.get("target_dir")
+            if item_target_dir:
+                # 항목에 지정된 대상 디렉토리가 있는 경우
+                target_dir = os.path.join(parent_dir, item_target_dir)
+            else:
+                # 카테고리 또는 데이터셋 유형에 따라 디렉토리 구성
+                category = item.get("category")
+                language_pair = item.get("language_pair")
+                
+                if category is not None:
+                    subdir = category
+                elif language_pair is not None:
+                    subdir = f"parallel/{language_pair}"
+                else:
+                    # 기본값: 파일명에서 확장자 제거한 값
+                    subdir = os.path.splitext(filename)[0] if filename else ""
+                
+                target_dir = os.path.join(parent_dir, subdir)
+            
+            # 같은 파일을 같은 위치로 두 번 받지 않도록 중복 제거
+            # (중복 작업은 같은 파일에 동시에 쓰게 되어 결과가 손상될 수 있음)
+            key = (canonicalize_url(url), os.path.join(target_dir, filename or os.path.basename(url)))
+            if key in job_index:
+                logger.debug(f"중복 다운로드 항목 건너뜀: {url}")
+                jobs[job_index[key]][3].append(item)
+                continue
+            job_index[key] = len(jobs)
+            
+            jobs.append((url, target_dir, filename, [item]))
+        
+        total_count = len(jobs)
         
-        # 파일별 진행률 추적을 위한 딕셔너리
+        # 전체 진행률 표시줄 (바이트 단위, 파일별 표시줄 대신 하나만 출력)
+        # 전체 크기는 각 파일의 크기를 알게 될 때마다 더해 나감
+        progress_bar = tqdm(total=0, unit="B", unit_scale=True, desc="전체 다운로드 진행률")
+        progress_bar.set_postfix_str(f"0/{total_count}개 파일")
+        progress_lock = threading.Lock()
+        
+        # 작업별 진행률 추적을 위한 딕셔너리 (작업 번호 -> (현재 크기, 전체 크기))
+        # 같은 URL도 저장 위치가 다르면 별도 작업이므로 URL이 아닌 작업 번호를 키로 사용
         file_progress = {}
         
-        def update_progress(url, current, total):
-            with self.downloader.lock:
-                file_progress[url] = (current, total)
+        def update_progress(job, current, total):
+            # 진행률 표시줄 전용 Lock만 사용 (메타데이터 저장용 Lock과 분리)
+            with progress_lock:
+                previous, previous_total = file_progress.get(job, (0, 0))
+                file_progress[job] = (current, total)
+                
+                # 전체 표시줄에는 이전 호출 이후 증가분만 반영
+                if total and not previous_total:
+                    progress_bar.total += total
+                progress_bar.update(current - previous)
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        with self.downloader.deferred_save(), \
+                concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # 다운로드 작업 제출
             future_to_url = {}
             
-            for item in download_list:
-                url = item["url"]
-                filename = item.get("filename")
-                
-                # 디렉토리 경로 설정
-                if "target_dir" in item and item["target_dir"]:
-                    # 항목에 지정된 대상 디렉토리가 있는 경우
-                    target_dir = os.path.join(parent_dir, item["target_dir"])
-                else:
-                    # 카테고리 또는 데이터셋 유형에 따라 디렉토리 구성
-                    subdir = None
-                    if "category" in item:
-                        subdir = item["category"]
-                    elif "language_pair" in item:
-                        subdir = f"parallel/{item['language_pair']}"
-                    else:
-                        # 기본값: 파일명에서 확장자 제거한 값
-                        subdir = os.path.splitext(filename)[0] if filename else ""
-                    
-                    target_dir = os.path.join(parent_dir, subdir)
-                
-                # 다운로드 작업 제출
+            for job, (url, target_dir, filename, items) in enumerate(jobs):
                 future = executor.submit(
-                    self.downloader.download_file,
+                    self.download_one,
                     url=url,
                     target_dir=target_dir,
                     filename=filename,
                     force=force,
-                    on_progress=lambda current, total, u=url: update_progress(u, current, total)
+                    auto_extract=auto_extract,
+                    stream_extract=stream_extract,
+                    on_progress=lambda current, total, j=job: update_progress(j, current, total),
+                    show_progress=False
                 )
-                future_to_url[future] = (url, target_dir, filename)
+                future_to_url[future] = (url, items)
             
             # 완료된 다운로드 처리
             for future in concurrent.futures.as_completed(future_to_url):
-                url, target_dir, filename = future_to_url[future]
+                url, items = future_to_url[future]
                 
                 try:
                     file_path = future.result()
-                    results.append(file_path)
-                    
-                    # 압축 해제
-                    if auto_extract and file_path.endswith((".tgz", ".gz", ".tar.gz", ".zip")):
-                        try:
-                            extract_dir = extract_archive(file_path, extract_dir=target_dir)
-                            logger.info(f"압축 해제 완료: {file_path} -> {extract_dir}")
-                        except Exception as e:
-                            logger.error(f"압축 해제 중 오류 발생: {file_path} - {e}")
-                    
+                    results.extend((item, file_path) for item in items)
                 except Exception as e:
                     logger.error(f"다운로드 실패: {url} - {e}")
                 
                 completed_count += 1
-                progress_bar.update(1)
+                with progress_lock:
+                    progress_bar.set_postfix_str(f"{completed_count}/{total_count}개 파일")
         
         progress_bar.close()
         logger.info(f"총 {total_count}개 파일 중 {completed_count}개 다운로드 완료")
         
         return results
+    
+    def download_one(self, url: str, target_dir: str, filename: Optional[str],
+                      force: bool, auto_extract: bool, stream_extract: bool = False,
+                      on_progress: Optional[Callable[[int, int], None]] = None,
+                      show_progress: bool = True) -> str:
+        """
+        단일 파일 다운로드 및 (선택적) 압축 해제 - 작업 스레드에서 실행
+        
+        압축 해제를 작업 스레드에서 수행하여 여러 아카이브가 동시에 풀리고,
+        완료된 결과를 수집하는 메인 스레드가 압축 해제 때문에 막히지 않도록 합니다.
+        
+        Returns:
+            다운로드된 파일 경로 (스트리밍 압축 해제한 경우 압축 해제 디렉토리)
+        """
+        if stream_extract:
+            # tar.gz 아카이브는 저장하지 않고 받으면서 바로 압축 해제
+            if (filename or os.path.basename(url)).endswith(STREAMABLE_ARCHIVE_EXTENSIONS):
+                return self.downloader.download_and_extract(
+                    url=url,
+                    target_dir=target_dir,
+                    force=force,
+                    on_progress=on_progress,
+                    show_progress=show_progress
+                )
+            
+            # 그 외 형식은 다운로드 후 압축 해제
+            auto_extract = True
+        
+        file_path = self.downloader.download_file(
+            url=url,
+            target_dir=target_dir,
+            filename=filename,
+            force=force,
+            on_progress=on_progress,
+            show_progress=show_progress
+        )
+        
+        # 압축 해제 (실패해도 다운로드 결과는 유지)
+        if auto_extract and file_path.endswith((".tgz", ".gz", ".tar.gz", ".zip")):
+            try:
+                extract_dir = extract_archive(file_path, extract_dir=target_dir)
+                logger.info(f"압축 해제 완료: {file_path} -> {extract_dir}")
+            except Exception as e:
+                logger.error(f"압축 해제 중 오류 발생: {file_path} - {e}")
+        
+        return file_path
 
 class StatMTDownloader:
     """statmt.org에서 데이터셋을 다운로드하기 위한 클래스"""
     
-    def __init__(self, cache_dir: Optional[str] = None, max_workers: int = 4):
+    def __init__(self, cache_dir: Optional[str] = None, max_workers: int = 4,
+                 max_connections: int = 16):
         """
         StatMTDownloader 초기화
         
         Args:
             cache_dir: 다운로드된 파일을 캐싱하는 디렉토리 (기본값: ~/.mt_dataset_cli/cache)
             max_workers: 최대 동시 다운로드 수
+            max_connections: 호스트별 최대 동시 HTTP 연결 수
+        
+        Raises:
+            ValueError: max_connections가 1보다 작은 경우
         """
-        self.downloader = Downloader(cache_dir)
+        # 크롤러와 다운로더가 공유하는 HTTP 세션 (연결 재사용 및 동시 연결 수 제한)
+        # (max_connections 검증은 create_session에서 수행)
+        self.session = create_session(max_connections)
+        
+        self.downloader = Downloader(cache_dir, session=self.session)
         self.multi_downloader = MultiDownloader(self.downloader, max_workers)
         
         # 메타데이터 캐시 참조
         self.metadata = self.downloader.metadata
     
+    def close(self):
+        """HTTP 세션을 닫고 연결 풀의 연결을 정리"""
+        self.session.close()
+    
+    def __enter__(self) -> "StatMTDownloader":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def list_datasets(self) -> List[Dict[str, str]]:
         """
         사용 가능한 데이터셋 목록 반환
@@ -288,7 +682,8 @@ class StatMTDownloader:
     
     def download(self, dataset_id: str, target_dir: Optional[str] = None, 
                 language_pair: Optional[str] = None, category: Optional[str] = None, 
-                auto_extract: bool = False, force: bool = False) -> Union[str, List[str]]:
+                auto_extract: bool = False, force: bool = False,
+                stream_extract: bool = False) -> Union[str, List[str]]:
         """
         지정된 데이터셋 다운로드
         
@@ -299,6 +694,7 @@ class StatMTDownloader:
             category: 데이터 카테고리 (WMT 데이터셋용)
             auto_extract: 다운로드 후 자동 압축 해제 여부
             force: 이미 존재하는 파일도 강제 다운로드할지 여부
+            stream_extract: tar.gz 아카이브를 저장하지 않고 받으면서 바로 압축 해제할지 여부
             
         Returns:
             다운로드된 파일 또는 파일 목록
@@ -308,7 +704,9 @@ class StatMTDownloader:
         os.makedirs(target_dir, exist_ok=True)
         
         # 크롤러 인스턴스 가져오기
-        crawler = CrawlerFactory.get_crawler(dataset_id)
+        crawler = CrawlerFactory.get_crawler(
+            dataset_id, session=self.session, cache_dir=self.downloader.cache_dir
+        )
         
         # 데이터셋 URL 목록 가져오기
         kwargs = {}
@@ -325,11 +723,13 @@ class StatMTDownloader:
         if len(dataset_urls) == 1:
             # 단일 파일인 경우
             url_info = dataset_urls[0]
-            return self.downloader.download_file(
+            return self.multi_downloader.download_one(
                 url=url_info["url"],
                 target_dir=target_dir,
                 filename=url_info.get("filename"),
-                force=force
+                force=force,
+                auto_extract=auto_extract,
+                stream_extract=stream_extract
             )
         else:
             # 여러 파일인 경우
@@ -337,13 +737,15 @@ class StatMTDownloader:
                 download_list=dataset_urls,
                 parent_dir=target_dir,
                 auto_extract=auto_extract,
-                force=force
+                force=force,
+                stream_extract=stream_extract
             )
     
     def download_multiple(self, dataset_configs: List[Dict], 
                          parent_dir: Optional[str] = None,
                          auto_extract: bool = False, 
-                         force: bool = False) -> Dict[str, List[str]]:
+                         force: bool = False,
+                         stream_extract: bool = False) -> Dict[str, List[str]]:
         """
         여러 데이터셋 동시 다운로드
         
@@ -356,6 +758,7 @@ class StatMTDownloader:
             parent_dir: 상위 다운로드 디렉토리 (기본값: 현재 디렉토리)
             auto_extract: 다운로드 후 자동 압축 해제 여부
             force: 이미 존재하는 파일도 강제 다운로드할지 여부
+            stream_extract: tar.gz 아카이브를 저장하지 않고 받으면서 바로 압축 해제할지 여부
             
         Returns:
             데이터셋별 다운로드된 파일 목록 딕셔너리
@@ -366,28 +769,37 @@ class StatMTDownloader:
         
         # 모든 데이터셋의 URL 수집
         all_urls = []
-        dataset_to_urls = {}
+        result: Dict[str, List[str]] = {}
         
-        for config in dataset_configs:
-            dataset_id = config["dataset_id"]
-            crawler = CrawlerFactory.get_crawler(dataset_id)
+        def collect_urls(config: Dict) -> List[Dict[str, str]]:
+            crawler = CrawlerFactory.get_crawler(
+                config["dataset_id"], session=self.session, cache_dir=self.downloader.cache_dir
+            )
             
             # 데이터셋별 특수 매개변수 처리
             kwargs = {k: v for k, v in config.items() if k not in ["dataset_id", "target_dir"]}
             
             # URL 목록 가져오기
-            dataset_urls = crawler.get_dataset_urls(**kwargs)
+            return crawler.get_dataset_urls(**kwargs)
+        
+        # 데이터셋별 크롤링은 서로 독립적이므로 동시에 수행 (결과 순서는 구성 순서 유지)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.multi_downloader.max_workers) as executor:
+            crawled_urls = list(executor.map(collect_urls, dataset_configs))
+        
+        for config, dataset_urls in zip(dataset_configs, crawled_urls):
+            dataset_id = config["dataset_id"]
             
             if dataset_urls:
                 # 대상 디렉토리 처리
                 target_subdir = config.get("target_dir", dataset_id)
                 
-                # URL 정보에 대상 디렉토리 추가
+                # URL 정보에 대상 디렉토리와 (결과를 데이터셋별로 정리하기 위한) 데이터셋 ID 추가
                 for url_info in dataset_urls:
                     url_info["target_dir"] = target_subdir
+                    url_info["dataset_id"] = dataset_id
                 
                 all_urls.extend(dataset_urls)
-                dataset_to_urls[dataset_id] = dataset_urls
+                result.setdefault(dataset_id, [])
             else:
                 logger.warning(f"다운로드할 URL을 찾을 수 없습니다: {dataset_id}")
         
@@ -395,20 +807,19 @@ class StatMTDownloader:
             raise ValueError("다운로드할 URL이 없습니다.")
         
         # 모든 URL 동시 다운로드
-        downloaded_files = self.multi_downloader.download_all(
+        downloaded_items = self.multi_downloader.download_items(
             download_list=all_urls,
             parent_dir=parent_dir,
             auto_extract=auto_extract,
-            force=force
+            force=force,
+            stream_extract=stream_extract
         )
         
         # 결과를 데이터셋별로 정리
-        result = {}
-        for dataset_id, urls in dataset_to_urls.items():
-            url_set = {url_info["url"] for url_info in urls}
-            result[dataset_id] = [
-                f for f in downloaded_files
-                if any(url in f for url in url_set)
-            ]
+        for url_info, file_path in downloaded_items:
+            files = result[url_info["dataset_id"]]
+            # 같은 데이터셋이 같은 파일을 여러 번 요청한 경우 한 번만 기록
+            if file_path not in files:
+                files.append(file_path)
         
         return result 
\ No newline at end of file
@@ -3,15 +3,151 @@
 """
 
 import os
+import json
 import gzip
 import shutil
+import fnmatch
 import tarfile
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # 설치되어 있으면 더 빠른 orjson 사용 (선택 의존성)
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # 설치되어 있으면 ISA-L 가속 gzip 구현 사용 (선택 의존성, gzip 모듈과 호환)
+    from isal import igzip
+except ImportError:
+    igzip = None
 
 logger = logging.getLogger(__name__)
 
+# HTTP 요청 타임아웃 (연결, 읽기) - 초 단위
+REQUEST_TIMEOUT = (5, 30)
+
+# 압축 해제한 데이터를 파일로 복사할 때의 버퍼 크기 (기본값 64 KiB보다 크게 하여 호출 횟수 감소)
+COPY_BUFFER_SIZE = 1024 * 1024
+
+def read_json_file(path: str) -> Any:
+    """
+    JSON 파일 읽기 (orjson이 있으면 orjson 사용)
+    
+    Args:
+        path: JSON 파일 경로
+    
+    Returns:
+        파싱된 객체
+    
+    Raises:
+        json.JSONDecodeError: 유효하지 않은 JSON인 경우
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    
+    if orjson is not None:
+        # orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스
+        return orjson.loads(data)
+    return json.loads(data)
+
+def write_json_file(path: str, obj: Any):
+    """
+    객체를 JSON 파일로 저장 (orjson이 있으면 orjson 사용, 비ASCII 문자는 그대로 저장)
+    
+    Args:
+        path: 저장할 파일 경로
+        obj: 저장할 객체
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj)
+    else:
+        data = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    
+    with open(path, "wb") as f:
+        f.write(data)
+
+def create_session(max_connections: int = 16) -> requests.Session:
+    """
+    연결 수가 제한된 HTTP 세션 생성
+    
+    호스트별 연결 풀 크기를 max_connections로 제한하고, 풀이 가득 차면 새 연결을
+    여는 대신 반환될 때까지 대기하도록 하여 서버에 대한 동시 연결 수를 제한합니다.
+    일시적인 서버 오류(502/503/504)와 연결 오류는 지수 백오프로 재시도합니다.
+    
+    Args:
+        max_connections: 호스트별 최대 동시 연결 수
+    
+    Returns:
+        HTTP 세션
+    
+    Raises:
+        ValueError: max_connections가 1보다 작은 경우 (연결 풀이 비어 요청이 무한히 대기함)
+    """
+    if max_connections < 1:
+        raise ValueError(f"max_connections는 1 이상이어야 합니다: {max_connections}")
+    
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    adapter = HTTPAdapter(pool_maxsize=max_connections, pool_block=True, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def canonicalize_url(url: str) -> str:
+    """
+    URL 정규화 (중복 판별용)
+    
+    스킴과 호스트를 소문자로 바꾸고, 프래그먼트와 경로 끝의 '/'를 제거합니다.
+    
+    Args:
+        url: 정규화할 URL
+    
+    Returns:
+        정규화된 URL
+    """
+    parts = urlsplit(url)
+    path = parts.path.rstrip("/")
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ""))
+
+def open_gzip(file, mode: str = "rb"):
+    """
+    gzip 파일 열기 (isal이 있으면 igzip 사용)
+    
+    Args:
+        file: 파일 경로 또는 파일 객체 (스트림도 가능)
+        mode: 열기 모드
+    
+    Returns:
+        gzip 파일 객체
+    """
+    if igzip is not None:
+        return igzip.open(file, mode)
+    return gzip.open(file, mode)
+
+def extract_tar(tar: tarfile.TarFile, extract_dir: str):
+    """
+    tar 아카이브의 모든 항목 압축 해제
+    
+    tarfile.data_filter를 지원하는 파이썬에서는 "data" 필터를 적용하여
+    절대 경로, 상위 디렉토리로 벗어나는 경로, 장치 파일 등 위험한 항목을 거부합니다.
+    
+    Args:
+        tar: 열린 tar 아카이브 (스트림 모드도 가능)
+        extract_dir: 압축 해제 디렉토리
+    """
+    if hasattr(tarfile, "data_filter"):
+        tar.extractall(path=extract_dir, filter="data")
+    else:
+        tar.extractall(path=extract_dir)
+
 def extract_archive(archive_path: str, extract_dir: Optional[str] = None) -> str:
     """
     아카이브 파일(tar.gz, tgz, gz 등) 압축 해제
@@ -38,17 +174,19 @@ def extract_archive(archive_path: str, extract_dir: Optional[str] = None) -> str
     logger.info(f"압축 해제 중: {archive_path} -> {extract_dir}")
     
     if filename.endswith(".tar.gz") or filename.endswith(".tgz"):
-        with tarfile.open(archive_path, "r:gz") as tar:
-            tar.extractall(path=extract_dir)
+        # 압축 해제는 open_gzip에 맡기고 tarfile은 비압축 스트림으로 읽음
+        with open_gzip(archive_path) as f_gz, tarfile.open(fileobj=f_gz, mode="r|") as tar:
+            extract_tar(tar, extract_dir)
     
     elif filename.endswith(".gz"):
         # .gz 파일은 단일 파일을 압축한 형식
         output_filename = os.path.splitext(filename)[0]
         output_path = os.path.join(extract_dir, output_filename)
         
-        with gzip.open(archive_path, "rb") as f_in:
+        # 압축 해제 결과는 커널 복사(sendfile)를 쓸 수 없으므로 큰 버퍼로 복사
+        with open_gzip(archive_path) as f_in:
             with open(output_path, "wb") as f_out:
-                shutil.copyfileobj(f_in, f_out)
+                shutil.copyfileobj(f_in, f_out, COPY_BUFFER_SIZE)
     
     else:
         raise ValueError(f"지원되지 않는 아카이브 형식: {filename}")
@@ -67,10 +205,10 @@ def get_language_pairs(dataset_id: str, metadata: Dict) -> List[str]:
     Returns:
         언어 쌍 목록 (예: ["de-en", "fr-en"])
     """
-    if dataset_id not in metadata["datasets"]:
+    dataset_info = metadata["datasets"].get(dataset_id)
+    if dataset_info is None:
         return []
     
-    dataset_info = metadata["datasets"][dataset_id]
     return dataset_info.get("language_pairs", [])
 
 def list_files_in_directory(directory: str, pattern: Optional[str] = None) -> List[str]:
@@ -87,33 +225,43 @@ def list_files_in_directory(directory: str, pattern: Optional[str] = None) -> Li
     if not os.path.exists(directory):
         return []
     
-    path = Path(directory)
+    # 하위 디렉토리를 포함하는 패턴(예: **/*.gz, sub/*.txt)은 pathlib의 glob으로 처리
+    if pattern and ("**" in pattern or "/" in pattern or os.sep in pattern):
+        return [str(f) for f in Path(directory).glob(pattern)]
     
-    if pattern:
-        return [str(f) for f in path.glob(pattern)]
-    else:
-        return [str(f) for f in path.glob("*") if f.is_file()]
+    # 한 단계 패턴은 os.scandir로 처리 (DirEntry가 디렉토리 읽기 시 얻은 파일 유형을 재사용하므로
+    # 항목마다 Path 객체를 만들거나 stat을 다시 호출하지 않음)
+    with os.scandir(directory) as entries:
+        if pattern:
+            return [entry.path for entry in entries if fnmatch.fnmatch(entry.name, pattern)]
+        else:
+            return [entry.path for entry in entries if entry.is_file()]
 
-def compute_file_checksum(file_path: str) -> str:
+def compute_file_checksum(file_path: str, algorithm: str = "md5") -> str:
     """
-    파일의 체크섬(MD5) 계산
+    파일의 체크섬 계산
     
     Args:
         file_path: 파일 경로
+        algorithm: hashlib 해시 알고리즘 이름 (기본값: md5, 예: sha256, blake2b)
     
     Returns:
-        MD5 체크섬 문자열
+        체크섬 16진수 문자열
     """
     import hashlib
     
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"파일을 찾을 수 없음: {file_path}")
     
-    md5 = hashlib.md5()
-    
     with open(file_path, "rb") as f:
+        # Python 3.11+에서는 읽기 루프를 C로 수행하는 file_digest 사용
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, algorithm).hexdigest()
+        
+        digest = hashlib.new(algorithm)
+        
         # 대용량 파일을 위한 청크 단위 읽기
-        for chunk in iter(lambda: f.read(4096), b""):
-            md5.update(chunk)
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
     
-    return md5.hexdigest() 
\ No newline at end of file
+    return digest.hexdigest()
\ No newline at end of file